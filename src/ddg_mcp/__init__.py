@@ -3,7 +3,16 @@ import asyncio
 
 def main():
     """Main entry point for the package."""
-    asyncio.run(server.main())
+    # Prefer uvloop's faster event loop when it is available
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(server.main())
 
 # Optionally expose other important items at package level
 __all__ = ['main', 'server']
\ No newline at end of file
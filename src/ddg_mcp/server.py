@@ -1,4 +1,9 @@
 import asyncio
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 from mcp.server.models import InitializationOptions
 import mcp.types as types
@@ -9,6 +14,164 @@ from duckduckgo_search import DDGS
 
 server = Server("ddg-mcp")
 
+def _call_ddgs(method: str, **params: Any) -> Any:
+    """
+    Call a DDGS method on a fresh client. Runs in a worker thread.
+    DDGS sleeps 0.75s before a request if the same instance made one in the
+    last 20s, and keeps chat history on the instance, so clients are never
+    shared between calls.
+    """
+    return getattr(DDGS(), method)(**params)
+
+class _TTLCache:
+    """
+    Bounded LRU cache whose entries also expire after a per-entry TTL.
+    Only touched from the event loop, so no locking is needed.
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: tuple) -> Any | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: tuple, value: Any, ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+# Seconds a cached result set stays fresh, per DDGS search method.
+_SEARCH_TTL = {
+    "text": 300,
+    "images": 3600,
+    "news": 60,
+    "videos": 300,
+}
+
+_search_cache = _TTLCache(maxsize=512)
+
+# Searches currently hitting the network, so identical concurrent calls share
+# one request instead of each missing the cache
+_inflight_searches: dict[tuple, asyncio.Future] = {}
+
+# Worker threads available for blocking DDGS calls
+_MAX_WORKERS = 16
+
+# Upper bound on DuckDuckGo requests in flight at once, however many tool
+# calls a client sends
+_DDG_SEM = asyncio.Semaphore(8)
+
+async def _fetch(key: tuple, method: str, params: dict[str, Any]) -> list[dict[str, str]]:
+    """Fetch a search from DuckDuckGo and store it in the cache."""
+    async with _DDG_SEM:
+        results = await asyncio.to_thread(_call_ddgs, method, **params)
+    _search_cache.set(key, results, _SEARCH_TTL[method])
+    return results
+
+async def _search(method: str, **params: Any) -> list[dict[str, str]]:
+    """
+    Run a DDGS search method in a worker thread.
+    Identical searches are served from a TTL cache instead of the network,
+    and concurrent identical searches wait on the same request.
+    """
+    key = (method, *sorted(params.items()))
+    results = _search_cache.get(key)
+    if results is not None:
+        return results
+
+    task = _inflight_searches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch(key, method, params))
+        _inflight_searches[key] = task
+        task.add_done_callback(lambda _: _inflight_searches.pop(key, None))
+    # Shield so one caller being cancelled doesn't cancel the others' request
+    return await asyncio.shield(task)
+
+# Per-result row templates, shared by every formatting call
+_TEXT_ROW = "{i}. {title}\n   URL: {href}\n   {body}\n\n"
+_IMAGE_ROW = "{i}. {title}\n   Source: {source}\n   URL: {url}\n   Size: {width}x{height}\n"
+_IMAGE_LINK = "   Image: {image}\n"
+_NEWS_ROW = "{i}. {title}\n   Source: {source}\n   Date: {date}\n   URL: {url}\n   {body}\n\n"
+_VIDEO_ROW = (
+    "{i}. {title}\n   Publisher: {publisher}\n   Duration: {duration}\n"
+    "   URL: {content}\n   Published: {published}\n   {description}\n\n"
+)
+
+def _format_text_results(keywords: str, results: list[dict[str, str]]) -> str:
+    """Format text search hits as a single block of text."""
+    parts = [f"Search results for '{keywords}':\n\n"]
+    for i, result in enumerate(results, 1):
+        get = result.get
+        parts.append(_TEXT_ROW.format(
+            i=i,
+            title=get('title', 'No title'),
+            href=get('href', 'No URL'),
+            body=get('body', 'No description'),
+        ))
+    return "".join(parts)
+
+def _format_image_results(keywords: str, results: list[dict[str, str]]) -> str:
+    """Format image search hits as a single block of text."""
+    parts = [f"Image search results for '{keywords}':\n\n"]
+    for i, result in enumerate(results, 1):
+        get = result.get
+        parts.append(_IMAGE_ROW.format(
+            i=i,
+            title=get('title', 'No title'),
+            source=get('source', 'Unknown'),
+            url=get('url', 'No URL'),
+            width=get('width', 'N/A'),
+            height=get('height', 'N/A'),
+        ))
+
+        image_url = get('image')
+        if image_url:
+            parts.append(_IMAGE_LINK.format(image=image_url))
+
+        parts.append("\n")
+    return "".join(parts)
+
+def _format_news_results(keywords: str, results: list[dict[str, str]]) -> str:
+    """Format news search hits as a single block of text."""
+    parts = [f"News search results for '{keywords}':\n\n"]
+    for i, result in enumerate(results, 1):
+        get = result.get
+        parts.append(_NEWS_ROW.format(
+            i=i,
+            title=get('title', 'No title'),
+            source=get('source', 'Unknown'),
+            date=get('date', 'No date'),
+            url=get('url', 'No URL'),
+            body=get('body', 'No description'),
+        ))
+    return "".join(parts)
+
+def _format_video_results(keywords: str, results: list[dict[str, str]]) -> str:
+    """Format video search hits as a single block of text."""
+    parts = [f"Video search results for '{keywords}':\n\n"]
+    for i, result in enumerate(results, 1):
+        get = result.get
+        parts.append(_VIDEO_ROW.format(
+            i=i,
+            title=get('title', 'No title'),
+            publisher=get('publisher', 'Unknown'),
+            duration=get('duration', 'Unknown'),
+            content=get('content', 'No URL'),
+            published=get('published', 'No date'),
+            description=get('description', 'No description'),
+        ))
+    return "".join(parts)
+
 @server.list_resources()
 async def handle_list_resources() -> list[types.Resource]:
     """
@@ -17,30 +180,37 @@ async def handle_list_resources() -> list[types.Resource]:
     """
     return []
 
+_PROMPTS = [
+    types.Prompt.model_construct(
+        name="search-results-summary",
+        description="Creates a summary of search results",
+        arguments=[
+            types.PromptArgument.model_construct(
+                name="query",
+                description="Search query to summarize results for",
+                required=True,
+            ),
+            types.PromptArgument.model_construct(
+                name="style",
+                description="Style of the summary (brief/detailed)",
+                required=False,
+            ),
+            types.PromptArgument.model_construct(
+                name="no_search",
+                description="Skip the search and only return the prompt (true/false)",
+                required=False,
+            )
+        ],
+    )
+]
+
 @server.list_prompts()
 async def handle_list_prompts() -> list[types.Prompt]:
     """
     List available prompts.
     Each prompt can have optional arguments to customize its behavior.
     """
-    return [
-        types.Prompt(
-            name="search-results-summary",
-            description="Creates a summary of search results",
-            arguments=[
-                types.PromptArgument(
-                    name="query",
-                    description="Search query to summarize results for",
-                    required=True,
-                ),
-                types.PromptArgument(
-                    name="style",
-                    description="Style of the summary (brief/detailed)",
-                    required=False,
-                )
-            ],
-        )
-    ]
+    return _PROMPTS
 
 @server.get_prompt()
 async def handle_get_prompt(
@@ -56,26 +226,45 @@ async def handle_get_prompt(
         query = arguments.get("query")
         style = arguments.get("style", "brief")
         detail_prompt = " Give extensive details." if style == "detailed" else ""
+        no_search = arguments.get("no_search", "false").lower() in ("true", "1", "yes")
         
-        # Perform search and get results
-        ddgs = DDGS()
-        results = ddgs.text(query, max_results=10)
-        
-        results_text = "\n\n".join([
-            f"Title: {result.get('title', 'No title')}\n"
-            f"URL: {result.get('href', 'No URL')}\n"
-            f"Description: {result.get('body', 'No description')}"
-            for result in results
-        ])
+        if no_search:
+            # Caller only wants the prompt scaffold, so skip the search
+            text = f"Search the web for '{query}' and summarize the results.{detail_prompt}"
+        else:
+            # Perform search and get results; repeat queries come from the cache
+            results = await _search(
+                "text",
+                keywords=query,
+                region="wt-wt",
+                safesearch="moderate",
+                timelimit=None,
+                max_results=10
+            )
+            
+            entries = []
+            for result in results:
+                get = result.get
+                entries.append(
+                    f"Title: {get('title', 'No title')}\n"
+                    f"URL: {get('href', 'No URL')}\n"
+                    f"Description: {get('body', 'No description')}"
+                )
+            
+            if entries:
+                results_text = "\n\n".join(entries)
+                text = f"Here are the search results for '{query}'. Please summarize them{detail_prompt}:\n\n{results_text}"
+            else:
+                text = f"No search results were found for '{query}'."
         
-        return types.GetPromptResult(
+        return types.GetPromptResult.model_construct(
             description=f"Summarize search results for '{query}'",
             messages=[
-                types.PromptMessage(
+                types.PromptMessage.model_construct(
                     role="user",
-                    content=types.TextContent(
+                    content=types.TextContent.model_construct(
                         type="text",
-                        text=f"Here are the search results for '{query}'. Please summarize them{detail_prompt}:\n\n{results_text}",
+                        text=text,
                     ),
                 )
             ],
@@ -83,308 +272,345 @@ async def handle_get_prompt(
     else:
         raise ValueError(f"Unknown prompt: {name}")
 
+# Schema fragments shared by several tools
+_KEYWORDS = {"type": "string", "description": "Search query keywords"}
+_REGION = {"type": "string", "description": "Region code (e.g., wt-wt, us-en, uk-en)", "default": "wt-wt"}
+_SAFESEARCH = {"type": "string", "enum": ["on", "moderate", "off"], "description": "Safe search level", "default": "moderate"}
+_TIMELIMIT_DWMY = {"type": "string", "enum": ["d", "w", "m", "y"], "description": "Time limit (d=day, w=week, m=month, y=year)"}
+_TIMELIMIT_DWM = {"type": "string", "enum": ["d", "w", "m"], "description": "Time limit (d=day, w=week, m=month)"}
+_MAX_RESULTS = {"type": "integer", "description": "Maximum number of results to return", "default": 10}
+
+_TOOLS = [
+    types.Tool.model_construct(
+        name="ddg-text-search",
+        description="Search the web for text results using DuckDuckGo",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keywords": _KEYWORDS,
+                "region": _REGION,
+                "safesearch": _SAFESEARCH,
+                "timelimit": _TIMELIMIT_DWMY,
+                "max_results": _MAX_RESULTS,
+            },
+            "required": ["keywords"],
+        },
+    ),
+    types.Tool.model_construct(
+        name="ddg-image-search",
+        description="Search the web for images using DuckDuckGo",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keywords": _KEYWORDS,
+                "region": _REGION,
+                "safesearch": _SAFESEARCH,
+                "timelimit": _TIMELIMIT_DWMY,
+                "size": {"type": "string", "enum": ["Small", "Medium", "Large", "Wallpaper"], "description": "Image size"},
+                "color": {"type": "string", "enum": ["color", "Monochrome", "Red", "Orange", "Yellow", "Green", "Blue", "Purple", "Pink", "Brown", "Black", "Gray", "Teal", "White"], "description": "Image color"},
+                "type_image": {"type": "string", "enum": ["photo", "clipart", "gif", "transparent", "line"], "description": "Image type"},
+                "layout": {"type": "string", "enum": ["Square", "Tall", "Wide"], "description": "Image layout"},
+                "license_image": {"type": "string", "enum": ["any", "Public", "Share", "ShareCommercially", "Modify", "ModifyCommercially"], "description": "Image license type"},
+                "max_results": _MAX_RESULTS,
+            },
+            "required": ["keywords"],
+        },
+    ),
+    types.Tool.model_construct(
+        name="ddg-news-search",
+        description="Search for news articles using DuckDuckGo",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keywords": _KEYWORDS,
+                "region": _REGION,
+                "safesearch": _SAFESEARCH,
+                "timelimit": _TIMELIMIT_DWM,
+                "max_results": _MAX_RESULTS,
+            },
+            "required": ["keywords"],
+        },
+    ),
+    types.Tool.model_construct(
+        name="ddg-video-search",
+        description="Search for videos using DuckDuckGo",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keywords": _KEYWORDS,
+                "region": _REGION,
+                "safesearch": _SAFESEARCH,
+                "timelimit": _TIMELIMIT_DWM,
+                "resolution": {"type": "string", "enum": ["high", "standard"], "description": "Video resolution"},
+                "duration": {"type": "string", "enum": ["short", "medium", "long"], "description": "Video duration"},
+                "license_videos": {"type": "string", "enum": ["creativeCommon", "youtube"], "description": "Video license type"},
+                "max_results": _MAX_RESULTS,
+            },
+            "required": ["keywords"],
+        },
+    ),
+    types.Tool.model_construct(
+        name="ddg-multi-search",
+        description="Run text, image, news and video searches concurrently using DuckDuckGo",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keywords": _KEYWORDS,
+                "region": _REGION,
+                "safesearch": _SAFESEARCH,
+                "max_results": {"type": "integer", "description": "Maximum number of results to return per search type", "default": 5},
+            },
+            "required": ["keywords"],
+        },
+    ),
+    types.Tool.model_construct(
+        name="ddg-ai-chat",
+        description="Chat with DuckDuckGo AI",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keywords": {"type": "string", "description": "Message or question to send to the AI"},
+                "model": {"type": "string", "enum": ["gpt-4o-mini", "llama-3.3-70b", "claude-3-haiku", "o3-mini", "mistral-small-3"], "description": "AI model to use", "default": "gpt-4o-mini"},
+            },
+            "required": ["keywords"],
+        },
+    )
+]
+
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """
     List available tools.
     Each tool specifies its arguments using JSON Schema validation.
     """
+    return _TOOLS
+
+# Argument specs for each tool: (name, default, required)
+_TEXT_SPEC = (
+    ("keywords", None, True),
+    ("region", "wt-wt", False),
+    ("safesearch", "moderate", False),
+    ("timelimit", None, False),
+    ("max_results", 10, False),
+)
+_IMAGE_SPEC = (
+    ("keywords", None, True),
+    ("region", "wt-wt", False),
+    ("safesearch", "moderate", False),
+    ("timelimit", None, False),
+    ("size", None, False),
+    ("color", None, False),
+    ("type_image", None, False),
+    ("layout", None, False),
+    ("license_image", None, False),
+    ("max_results", 10, False),
+)
+_NEWS_SPEC = _TEXT_SPEC
+_VIDEO_SPEC = (
+    ("keywords", None, True),
+    ("region", "wt-wt", False),
+    ("safesearch", "moderate", False),
+    ("timelimit", None, False),
+    ("resolution", None, False),
+    ("duration", None, False),
+    ("license_videos", None, False),
+    ("max_results", 10, False),
+)
+_MULTI_SPEC = (
+    ("keywords", None, True),
+    ("region", "wt-wt", False),
+    ("safesearch", "moderate", False),
+    ("max_results", 5, False),
+)
+_CHAT_SPEC = (
+    ("keywords", None, True),
+    ("model", "gpt-4o-mini", False),
+)
+
+def _extract(arguments: dict, spec: tuple[tuple[str, Any, bool], ...]) -> dict[str, Any]:
+    """
+    Read every argument named in spec in a single pass, applying defaults.
+    Raises ValueError if a required argument is missing or empty.
+    """
+    get = arguments.get
+    params = {}
+    for name, default, required in spec:
+        value = get(name, default)
+        if required and not value:
+            raise ValueError(f"Missing {name}")
+        params[name] = value
+    return params
+
+async def _handle_text(
+    arguments: dict
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Run a DuckDuckGo text search.
+    """
+    params = _extract(arguments, _TEXT_SPEC)
+    results = await _search("text", **params)
+    
     return [
-        types.Tool(
-            name="ddg-text-search",
-            description="Search the web for text results using DuckDuckGo",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "keywords": {"type": "string", "description": "Search query keywords"},
-                    "region": {"type": "string", "description": "Region code (e.g., wt-wt, us-en, uk-en)", "default": "wt-wt"},
-                    "safesearch": {"type": "string", "enum": ["on", "moderate", "off"], "description": "Safe search level", "default": "moderate"},
-                    "timelimit": {"type": "string", "enum": ["d", "w", "m", "y"], "description": "Time limit (d=day, w=week, m=month, y=year)"},
-                    "max_results": {"type": "integer", "description": "Maximum number of results to return", "default": 10},
-                },
-                "required": ["keywords"],
-            },
-        ),
-        types.Tool(
-            name="ddg-image-search",
-            description="Search the web for images using DuckDuckGo",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "keywords": {"type": "string", "description": "Search query keywords"},
-                    "region": {"type": "string", "description": "Region code (e.g., wt-wt, us-en, uk-en)", "default": "wt-wt"},
-                    "safesearch": {"type": "string", "enum": ["on", "moderate", "off"], "description": "Safe search level", "default": "moderate"},
-                    "timelimit": {"type": "string", "enum": ["d", "w", "m", "y"], "description": "Time limit (d=day, w=week, m=month, y=year)"},
-                    "size": {"type": "string", "enum": ["Small", "Medium", "Large", "Wallpaper"], "description": "Image size"},
-                    "color": {"type": "string", "enum": ["color", "Monochrome", "Red", "Orange", "Yellow", "Green", "Blue", "Purple", "Pink", "Brown", "Black", "Gray", "Teal", "White"], "description": "Image color"},
-                    "type_image": {"type": "string", "enum": ["photo", "clipart", "gif", "transparent", "line"], "description": "Image type"},
-                    "layout": {"type": "string", "enum": ["Square", "Tall", "Wide"], "description": "Image layout"},
-                    "license_image": {"type": "string", "enum": ["any", "Public", "Share", "ShareCommercially", "Modify", "ModifyCommercially"], "description": "Image license type"},
-                    "max_results": {"type": "integer", "description": "Maximum number of results to return", "default": 10},
-                },
-                "required": ["keywords"],
-            },
-        ),
-        types.Tool(
-            name="ddg-news-search",
-            description="Search for news articles using DuckDuckGo",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "keywords": {"type": "string", "description": "Search query keywords"},
-                    "region": {"type": "string", "description": "Region code (e.g., wt-wt, us-en, uk-en)", "default": "wt-wt"},
-                    "safesearch": {"type": "string", "enum": ["on", "moderate", "off"], "description": "Safe search level", "default": "moderate"},
-                    "timelimit": {"type": "string", "enum": ["d", "w", "m"], "description": "Time limit (d=day, w=week, m=month)"},
-                    "max_results": {"type": "integer", "description": "Maximum number of results to return", "default": 10},
-                },
-                "required": ["keywords"],
-            },
-        ),
-        types.Tool(
-            name="ddg-video-search",
-            description="Search for videos using DuckDuckGo",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "keywords": {"type": "string", "description": "Search query keywords"},
-                    "region": {"type": "string", "description": "Region code (e.g., wt-wt, us-en, uk-en)", "default": "wt-wt"},
-                    "safesearch": {"type": "string", "enum": ["on", "moderate", "off"], "description": "Safe search level", "default": "moderate"},
-                    "timelimit": {"type": "string", "enum": ["d", "w", "m"], "description": "Time limit (d=day, w=week, m=month)"},
-                    "resolution": {"type": "string", "enum": ["high", "standard"], "description": "Video resolution"},
-                    "duration": {"type": "string", "enum": ["short", "medium", "long"], "description": "Video duration"},
-                    "license_videos": {"type": "string", "enum": ["creativeCommon", "youtube"], "description": "Video license type"},
-                    "max_results": {"type": "integer", "description": "Maximum number of results to return", "default": 10},
-                },
-                "required": ["keywords"],
-            },
+        types.TextContent.model_construct(
+            type="text",
+            text=_format_text_results(params["keywords"], results),
         )
     ]
 
-@server.call_tool()
-async def handle_call_tool(
-    name: str, arguments: dict | None
+async def _handle_image(
+    arguments: dict
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """
-    Handle tool execution requests.
+    Run a DuckDuckGo image search.
     """
-    if not arguments:
-        raise ValueError("Missing arguments")
-
-    if name == "ddg-text-search":
-        keywords = arguments.get("keywords")
-        if not keywords:
-            raise ValueError("Missing keywords")
-        
-        region = arguments.get("region", "wt-wt")
-        safesearch = arguments.get("safesearch", "moderate")
-        timelimit = arguments.get("timelimit")
-        max_results = arguments.get("max_results", 10)
-        
-        # Perform search
-        ddgs = DDGS()
-        results = ddgs.text(
-            keywords=keywords,
-            region=region,
-            safesearch=safesearch,
-            timelimit=timelimit,
-            max_results=max_results
-        )
-        
-        # Format results
-        formatted_results = f"Search results for '{keywords}':\n\n"
-        for i, result in enumerate(results, 1):
-            formatted_results += (
-                f"{i}. {result.get('title', 'No title')}\n"
-                f"   URL: {result.get('href', 'No URL')}\n"
-                f"   {result.get('body', 'No description')}\n\n"
-            )
-        
-        return [
-            types.TextContent(
-                type="text",
-                text=formatted_results,
-            )
-        ]
+    params = _extract(arguments, _IMAGE_SPEC)
+    results = await _search("images", **params)
     
-    elif name == "ddg-image-search":
-        keywords = arguments.get("keywords")
-        if not keywords:
-            raise ValueError("Missing keywords")
-        
-        region = arguments.get("region", "wt-wt")
-        safesearch = arguments.get("safesearch", "moderate")
-        timelimit = arguments.get("timelimit")
-        size = arguments.get("size")
-        color = arguments.get("color")
-        type_image = arguments.get("type_image")
-        layout = arguments.get("layout")
-        license_image = arguments.get("license_image")
-        max_results = arguments.get("max_results", 10)
-        
-        # Perform search
-        ddgs = DDGS()
-        results = ddgs.images(
-            keywords=keywords,
-            region=region,
-            safesearch=safesearch,
-            timelimit=timelimit,
-            size=size,
-            color=color,
-            type_image=type_image,
-            layout=layout,
-            license_image=license_image,
-            max_results=max_results
+    return [
+        types.TextContent.model_construct(
+            type="text",
+            text=_format_image_results(params["keywords"], results),
         )
-        
-        # Format results
-        formatted_results = f"Image search results for '{keywords}':\n\n"
-        
-        text_results = []
-        
-        for i, result in enumerate(results, 1):
-            result_text = (
-                f"{i}. {result.get('title', 'No title')}\n"
-                f"   Source: {result.get('source', 'Unknown')}\n"
-                f"   URL: {result.get('url', 'No URL')}\n"
-                f"   Size: {result.get('width', 'N/A')}x{result.get('height', 'N/A')}\n"
-            )
-            
-            image_url = result.get('image')
-            if image_url:
-                result_text += f"   Image: {image_url}\n"
-            
-            result_text += "\n"
-            
-            text_results.append(
-                types.TextContent(
-                    type="text",
-                    text=result_text
-                )
-            )
-        
-        return text_results
+    ]
+
+async def _handle_news(
+    arguments: dict
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Run a DuckDuckGo news search.
+    """
+    params = _extract(arguments, _NEWS_SPEC)
+    results = await _search("news", **params)
     
-    elif name == "ddg-news-search":
-        keywords = arguments.get("keywords")
-        if not keywords:
-            raise ValueError("Missing keywords")
-        
-        region = arguments.get("region", "wt-wt")
-        safesearch = arguments.get("safesearch", "moderate")
-        timelimit = arguments.get("timelimit")
-        max_results = arguments.get("max_results", 10)
-        
-        # Perform search
-        ddgs = DDGS()
-        results = ddgs.news(
-            keywords=keywords,
-            region=region,
-            safesearch=safesearch,
-            timelimit=timelimit,
-            max_results=max_results
+    return [
+        types.TextContent.model_construct(
+            type="text",
+            text=_format_news_results(params["keywords"], results),
         )
-        
-        # Format results
-        formatted_results = f"News search results for '{keywords}':\n\n"
-        for i, result in enumerate(results, 1):
-            formatted_results += (
-                f"{i}. {result.get('title', 'No title')}\n"
-                f"   Source: {result.get('source', 'Unknown')}\n"
-                f"   Date: {result.get('date', 'No date')}\n"
-                f"   URL: {result.get('url', 'No URL')}\n"
-                f"   {result.get('body', 'No description')}\n\n"
-            )
-        
-        return [
-            types.TextContent(
-                type="text",
-                text=formatted_results,
-            )
-        ]
+    ]
+
+async def _handle_video(
+    arguments: dict
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Run a DuckDuckGo video search.
+    """
+    params = _extract(arguments, _VIDEO_SPEC)
+    results = await _search("videos", **params)
     
-    elif name == "ddg-video-search":
-        keywords = arguments.get("keywords")
-        if not keywords:
-            raise ValueError("Missing keywords")
-        
-        region = arguments.get("region", "wt-wt")
-        safesearch = arguments.get("safesearch", "moderate")
-        timelimit = arguments.get("timelimit")
-        resolution = arguments.get("resolution")
-        duration = arguments.get("duration")
-        license_videos = arguments.get("license_videos")
-        max_results = arguments.get("max_results", 10)
-        
-        # Perform search
-        ddgs = DDGS()
-        results = ddgs.videos(
-            keywords=keywords,
-            region=region,
-            safesearch=safesearch,
-            timelimit=timelimit,
-            resolution=resolution,
-            duration=duration,
-            license_videos=license_videos,
-            max_results=max_results
+    return [
+        types.TextContent.model_construct(
+            type="text",
+            text=_format_video_results(params["keywords"], results),
         )
-        
-        # Format results
-        formatted_results = f"Video search results for '{keywords}':\n\n"
-        for i, result in enumerate(results, 1):
-            formatted_results += (
-                f"{i}. {result.get('title', 'No title')}\n"
-                f"   Publisher: {result.get('publisher', 'Unknown')}\n"
-                f"   Duration: {result.get('duration', 'Unknown')}\n"
-                f"   URL: {result.get('content', 'No URL')}\n"
-                f"   Published: {result.get('published', 'No date')}\n"
-                f"   {result.get('description', 'No description')}\n\n"
-            )
-        
-        return [
-            types.TextContent(
-                type="text",
-                text=formatted_results,
-            )
-        ]
+    ]
+
+async def _handle_multi(
+    arguments: dict
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Run text, image, news and video searches concurrently.
+    """
+    params = _extract(arguments, _MULTI_SPEC)
+    params["timelimit"] = None
+    keywords = params["keywords"]
     
-    elif name == "ddg-ai-chat":
-        keywords = arguments.get("keywords")
-        if not keywords:
-            raise ValueError("Missing keywords")
-        
-        model = arguments.get("model", "gpt-4o-mini")
-        
-        # Perform AI chat
-        ddgs = DDGS()
-        result = ddgs.chat(
-            keywords=keywords,
-            model=model
+    # Fan out to every search type at once; one failing search should not
+    # hide the results of the others
+    formatters = (
+        ("text", "Text", _format_text_results),
+        ("images", "Image", _format_image_results),
+        ("news", "News", _format_news_results),
+        ("videos", "Video", _format_video_results),
+    )
+    results = await asyncio.gather(
+        *(_search(method, **params) for method, _, _ in formatters),
+        return_exceptions=True,
+    )
+    
+    # Format results
+    sections = []
+    for (_, label, formatter), result in zip(formatters, results):
+        if isinstance(result, Exception):
+            sections.append(f"{label} search failed: {result}\n\n")
+        else:
+            sections.append(formatter(keywords, result))
+    
+    return [
+        types.TextContent.model_construct(
+            type="text",
+            text="".join(sections),
         )
-        
-        return [
-            types.TextContent(
-                type="text",
-                text=f"DuckDuckGo AI ({model}) response:\n\n{result}",
-            )
-        ]
+    ]
+
+async def _handle_chat(
+    arguments: dict
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Send a message to DuckDuckGo AI chat.
+    """
+    params = _extract(arguments, _CHAT_SPEC)
     
-    else:
+    # Perform AI chat
+    async with _DDG_SEM:
+        result = await asyncio.to_thread(_call_ddgs, "chat", **params)
+    
+    return [
+        types.TextContent.model_construct(
+            type="text",
+            text=f"DuckDuckGo AI ({params['model']}) response:\n\n{result}",
+        )
+    ]
+
+_HANDLERS = {
+    "ddg-text-search": _handle_text,
+    "ddg-image-search": _handle_image,
+    "ddg-news-search": _handle_news,
+    "ddg-video-search": _handle_video,
+    "ddg-multi-search": _handle_multi,
+    "ddg-ai-chat": _handle_chat,
+}
+
+@server.call_tool()
+async def handle_call_tool(
+    name: str, arguments: dict | None
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Handle tool execution requests.
+    """
+    if not arguments:
+        raise ValueError("Missing arguments")
+
+    # Interned names match the _HANDLERS keys by identity
+    handler = _HANDLERS.get(sys.intern(name))
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
 
+    return await handler(arguments)
+
+# Built once the handlers above are registered, since the advertised
+# capabilities depend on them
+_INIT_OPTIONS = InitializationOptions.model_construct(
+    server_name="ddg-mcp",
+    server_version="0.1.0",
+    capabilities=server.get_capabilities(
+        notification_options=NotificationOptions(),
+        experimental_capabilities={},
+    ),
+)
+
 async def main():
+    # Give the blocking DDGS calls a bounded pool of their own
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="ddg")
+    )
+
     # Run the server using stdin/stdout streams
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
             write_stream,
-            InitializationOptions(
-                server_name="ddg-mcp",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
-                ),
-            ),
+            _INIT_OPTIONS,
         )
 
 if __name__ == "__main__":
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from ddg_mcp import server
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(server, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def fake_ddgs(monkeypatch):
+    calls = []
+    release = threading.Event()
+    release.set()
+
+    class FakeDDGS:
+        def text(self, **params):
+            release.wait(5)
+            calls.append(("text", params))
+            return [{"title": params["keywords"], "href": "h", "body": "b"}]
+
+        def news(self, **params):
+            calls.append(("news", params))
+            return [{"title": params["keywords"]}]
+
+    monkeypatch.setattr(server, "DDGS", FakeDDGS)
+    monkeypatch.setattr(server, "_search_cache", server._TTLCache(maxsize=512))
+    monkeypatch.setattr(server, "_inflight_searches", {})
+    return calls, release
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = server._TTLCache(maxsize=2)
+    cache.set(("a",), 1, ttl=60)
+
+    clock[0] += 59
+    assert cache.get(("a",)) == 1
+    clock[0] += 1
+    assert cache.get(("a",)) is None
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = server._TTLCache(maxsize=2)
+    cache.set(("a",), 1, ttl=60)
+    cache.set(("b",), 2, ttl=60)
+    cache.get(("a",))
+    cache.set(("c",), 3, ttl=60)
+
+    assert cache.get(("a",)) == 1
+    assert cache.get(("b",)) is None
+    assert cache.get(("c",)) == 3
+
+
+def test_search_uses_per_method_ttl(clock, fake_ddgs):
+    calls, _ = fake_ddgs
+
+    async def run():
+        await server._search("news", keywords="q")
+        await server._search("text", keywords="q")
+        clock[0] += server._SEARCH_TTL["news"]
+        await server._search("news", keywords="q")
+        await server._search("text", keywords="q")
+
+    asyncio.run(run())
+    assert [method for method, _ in calls] == ["news", "text", "news"]
+
+
+def test_summary_prompt_shares_text_search_cache(clock, fake_ddgs):
+    calls, _ = fake_ddgs
+
+    async def run():
+        await server.handle_call_tool("ddg-text-search", {"keywords": "q"})
+        await server.handle_get_prompt("search-results-summary", {"query": "q"})
+
+    asyncio.run(run())
+    assert len(calls) == 1
+
+
+def test_concurrent_identical_searches_share_one_request(clock, fake_ddgs):
+    calls, release = fake_ddgs
+    release.clear()
+
+    async def run():
+        searches = [
+            asyncio.create_task(server._search("text", keywords="q"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*searches)
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert results[0] is results[1] is results[2]
+    assert server._inflight_searches == {}